@@ -1 +1,2 @@
 from .test_utilities import *
+from .test_views import *
@@ -0,0 +1,172 @@
+from unittest import TestCase
+
+from ..utilities import indices
+from ..views import SequenceView, SequenceWindow
+
+__all__ = ["TestSequenceView", "TestSequenceWindow"]
+
+
+class TestSequenceView(TestCase):
+
+    def testBasic(self):
+        target = [0, 1, 2, 3, 4]
+        view = SequenceView(target)
+
+        self.assertEqual(len(view), 5)
+        self.assertEqual(list(view), [0, 1, 2, 3, 4])
+        self.assertEqual(list(reversed(view)), [4, 3, 2, 1, 0])
+
+        self.assertEqual(view[0], 0)
+        self.assertEqual(view[-1], 4)
+
+        self.assertIn(3, view)
+        self.assertNotIn(5, view)
+
+    def testDynamic(self):
+        target = [0, 1, 2]
+        view = SequenceView(target)
+
+        target.append(3)
+
+        self.assertEqual(len(view), 4)
+        self.assertEqual(list(view), [0, 1, 2, 3])
+
+    def testWindowing(self):
+        target = [0, 1, 2, 3, 4]
+        view = SequenceView(target)
+
+        window = view[1:4]
+
+        self.assertIsInstance(window, SequenceWindow)
+        self.assertEqual(list(window), [1, 2, 3])
+
+    def testEquality(self):
+        view = SequenceView([0, 1, 2])
+
+        self.assertEqual(view, SequenceView([0, 1, 2]))
+        self.assertNotEqual(view, SequenceView([0, 1]))
+        self.assertNotEqual(view, SequenceView([0, 1, 3]))
+
+
+class TestSequenceWindow(TestCase):
+
+    def testBasic(self):
+        target = [0, 1, 2, 3, 4]
+
+        window = SequenceWindow(target)
+
+        self.assertEqual(len(window), 5)
+        self.assertEqual(list(window), [0, 1, 2, 3, 4])
+        self.assertEqual(list(reversed(window)), [4, 3, 2, 1, 0])
+
+        window = SequenceWindow(target, slice(1, 4))
+
+        self.assertEqual(len(window), 3)
+        self.assertEqual(list(window), [1, 2, 3])
+        self.assertEqual(list(reversed(window)), [3, 2, 1])
+
+        window = SequenceWindow(target, slice(None, None, 2))
+
+        self.assertEqual(len(window), 3)
+        self.assertEqual(list(window), [0, 2, 4])
+        self.assertEqual(list(reversed(window)), [4, 2, 0])
+
+        window = SequenceWindow(target, slice(None, None, -1))
+
+        self.assertEqual(len(window), 5)
+        self.assertEqual(list(window), [4, 3, 2, 1, 0])
+        self.assertEqual(list(reversed(window)), [0, 1, 2, 3, 4])
+
+    def testGetItem(self):
+        target = [0, 1, 2, 3, 4]
+
+        window = SequenceWindow(target, slice(1, 4))
+
+        self.assertEqual(window[0], 1)
+        self.assertEqual(window[2], 3)
+        self.assertEqual(window[-1], 3)
+        self.assertEqual(window[-3], 1)
+
+        with self.assertRaises(IndexError):
+            window[3]
+        with self.assertRaises(IndexError):
+            window[-4]
+
+        sub_window = window[1:]
+
+        self.assertIsInstance(sub_window, SequenceWindow)
+        self.assertEqual(list(sub_window), [2, 3])
+
+    def testDynamic(self):
+        target = [0, 1, 2]
+
+        window = SequenceWindow(target, slice(1, None))
+
+        self.assertEqual(list(window), [1, 2])
+
+        target.append(3)
+
+        self.assertEqual(len(window), 3)
+        self.assertEqual(list(window), [1, 2, 3])
+        self.assertEqual(window[-1], 3)
+
+        del target[:]
+
+        self.assertEqual(len(window), 0)
+        self.assertEqual(list(window), [])
+
+    def testSlicing(self):
+
+        # Slicing a window must select the same elements as a window nested
+        # over it would - that is, the key is resolved by indices() against
+        # the window's current length, including its stride-aligned clipping
+        # of out-of-bounds starts (see test_utilities.py)
+
+        target = list(range(10))
+
+        outer_slices = [
+            slice(None),
+            slice(2, 8),
+            slice(None, None, 2),
+            slice(None, None, -1),
+            slice(8, 1, -3),
+            slice(-6, -2),
+            slice(0, 0),
+        ]
+        inner_slices = outer_slices + [
+            slice(-15, None, 2),
+            slice(14, None, -2),
+            slice(-15, 15, 3),
+            slice(15, -15, -3),
+        ]
+
+        for outer in outer_slices:
+            for inner in inner_slices:
+                with self.subTest(outer=outer, inner=inner):
+                    sub_keys = indices(outer, len(target)).range()
+                    inner_keys = indices(inner, len(sub_keys)).range()
+
+                    res = list(SequenceWindow(target, outer)[inner])
+                    exp = [target[sub_keys[key]] for key in inner_keys]
+
+                    self.assertEqual(res, exp)
+
+    def testContains(self):
+        target = [0, 1, 2, 3, 4]
+
+        window = SequenceWindow(target, slice(1, 4))
+
+        self.assertIn(1, window)
+        self.assertIn(3, window)
+        self.assertNotIn(0, window)
+        self.assertNotIn(4, window)
+
+    def testEquality(self):
+        target = [0, 1, 2, 3, 4]
+
+        window = SequenceWindow(target, slice(1, 4))
+
+        self.assertEqual(window, SequenceWindow(target, slice(1, 4)))
+        self.assertEqual(window, SequenceView([1, 2, 3]))
+        self.assertNotEqual(window, SequenceWindow(target, slice(0, 4)))
+        self.assertNotEqual(window, SequenceWindow(target))
@@ -1,5 +1,6 @@
 import operator
 from abc import abstractmethod
+from functools import lru_cache
 from typing import NamedTuple, Optional, Protocol, SupportsIndex
 
 __all__ = [
@@ -36,11 +37,11 @@ class RangeProperties(NamedTuple):
 
     def range(self) -> range:
         """Return a ``range`` of the tuple's indices"""
-        return range(self.start, self.stop, self.step)
+        return range(*self)
 
     def slice(self) -> slice:
         """Return a ``slice`` of the tuple's indices"""
-        return slice(self.start, self.stop, self.step)
+        return slice(*self)
 
 
 def indices(rng: SupportsRangeProperties, len: SupportsIndex) -> RangeProperties:
@@ -54,18 +55,52 @@ def indices(rng: SupportsRangeProperties, len: SupportsIndex) -> RangeProperties
     https://github.com/python/cpython/blob/main/Objects/sliceobject.c
 
     Raises ``ValueError`` if the step of ``rng`` is 0.
+
+    Results are memoized by the normalized ``(start, stop, step, len)``
+    quadruple, as windows are commonly re-resolved with identical parameters
+    (e.g., by repeated queries of an unchanged view).
+    """
+    if type(len) is not int:
+        len = operator.index(len)
+
+    return _indices(*_properties(rng), len)
+
+
+def _properties(rng: SupportsRangeProperties) -> "tuple[Optional[int], Optional[int], Optional[int]]":
+    """Return the start, stop, and step properties of ``rng`` as true ints, or
+    ``None`` where absent
     """
     start = rng.start
     stop  = rng.stop
     step  = rng.step
 
-    len = operator.index(len)
+    # Indexing is skipped for true ints, here and below - operator.index() is
+    # a guaranteed no-op for them, but costs a call each
 
+    if start is not None and type(start) is not int:
+        start = operator.index(start)
+    if stop is not None and type(stop) is not int:
+        stop = operator.index(stop)
+    if step is not None and type(step) is not int:
+        step = operator.index(step)
+
+    return (start, stop, step)
+
+
+@lru_cache(maxsize=256)
+def _indices(
+    start: Optional[int],
+    stop: Optional[int],
+    step: Optional[int],
+    len: int,
+) -> RangeProperties:
+    """Cached core of ``indices()`` - arguments must be true ints, or ``None``
+    where the public signature permits
+    """
     if step is None:
         step = 1
         reverse = False
     else:
-        step = operator.index(step)
         if not step:
             raise ValueError("step must be non-zero")
         reverse = step < 0
@@ -75,7 +110,6 @@ def indices(rng: SupportsRangeProperties, len: SupportsIndex) -> RangeProperties
     if start is None:
         start = upper if reverse else lower
     else:
-        start = operator.index(start)
         if start < 0:
             start += len
             if start < lower:
@@ -89,7 +123,6 @@ def indices(rng: SupportsRangeProperties, len: SupportsIndex) -> RangeProperties
     if stop is None:
         stop = lower if reverse else upper
     else:
-        stop = operator.index(stop)
         if stop < 0:
             stop += len
             if stop < lower:
@@ -1,9 +1,10 @@
+import operator
 from abc import ABCMeta
 from collections.abc import Iterator, Sequence
 from reprlib import recursive_repr
 from typing import Any, Optional, SupportsIndex, TypeVar, overload
 
-from .utilities import RangeProperties, indices
+from .utilities import RangeProperties, _indices, _properties
 
 __all__ = [
     "SequenceViewLike",
@@ -16,6 +17,19 @@ T_co = TypeVar("T_co", covariant=True)
 SequenceViewT = TypeVar("SequenceViewT", bound="SequenceView")
 
 
+def _subslice(sub_keys: range) -> slice:
+    """Return a ``slice`` equivalent to a non-empty ``sub_keys`` range when
+    applied to the sequence whose length the range was resolved against
+
+    A negative stop (which can only arise alongside a negative step, from
+    reverse or reversed sub-keys) means "down to and including index 0" - the
+    equivalent slice must use ``None``, as a negative stop would be taken
+    relative to the sequence's end.
+    """
+    stop = sub_keys.stop
+    return slice(sub_keys.start, stop if stop >= 0 else None, sub_keys.step)
+
+
 class SequenceViewLike(Sequence[T_co], metaclass=ABCMeta):
     """Abstract base class for all sequence views
 
@@ -45,10 +59,15 @@ class SequenceView(SequenceViewLike[T]):
         return f"{self.__class__.__name__}(target={self._target!r})"
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
         if isinstance(other, SequenceView):
             if len(self) != len(other):
                 return False
-            return all(map(lambda x, y: x is y or x == y, self, other))
+            for x, y in zip(self, other):
+                if x is not y and x != y:
+                    return False
+            return True
         return NotImplemented
 
     def __len__(self) -> int:
@@ -65,10 +84,10 @@ class SequenceView(SequenceViewLike[T]):
         return self._target[key]
 
     def __iter__(self) -> Iterator[T]:
-        yield from iter(self._target)
+        return iter(self._target)
 
     def __reversed__(self) -> Iterator[T]:
-        yield from reversed(self._target)
+        return reversed(self._target)
 
     def __contains__(self, value: Any) -> bool:
         return value in self._target
@@ -87,20 +106,37 @@ class SequenceWindow(SequenceView[T]):
     parameters are used to define a "window" of the target sequence for which
     the view is capable of seeing. Instances of ``SequenceWindow`` otherwise
     behave identically to instances of ``SequenceView``.
+
+    Slicing a window resolves the selection against the target's current
+    length, producing a new ``SequenceWindow`` directly over the target rather
+    than a chain of nested views - retrievals through a derived window are
+    thus independent of the number of slicing operations that produced it.
     """
 
-    __slots__ = ("_window",)
+    __slots__ = ("_window", "_window_args", "_cache_len", "_cache_keys")
 
     def __init__(self, target: Sequence[T], window: slice = slice(None, None)) -> None:
         super().__init__(target)
         self._window = window
+        self._window_args = _properties(window)
+        self._cache_len = -1
+        self._cache_keys = range(0)
 
     @recursive_repr("...")
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(target={self._target!r}, window={self._window!r})"
 
+    def __eq__(self, other: Any) -> bool:
+        if (
+            isinstance(other, SequenceWindow)
+            and self._target is other._target
+            and self._window_args == other._window_args
+        ):
+            return True
+        return super().__eq__(other)
+
     def __len__(self) -> int:
-        sub_keys = self.indices().range()
+        sub_keys = self._subkeys()
         return len(sub_keys)
 
     @overload
@@ -110,25 +146,55 @@ class SequenceWindow(SequenceView[T]):
 
     def __getitem__(self, key):
         if isinstance(key, slice):
-            return SequenceWindow(self, key)
-        sub_keys = self.indices().range()
-        try:
-            value = self._target[sub_keys[key]]
-        except IndexError as error:
-            raise IndexError("window index out of range") from error
-        else:
-            return value
+            if key.start is None and key.stop is None and key.step is None:
+                return SequenceWindow(self._target, self._window)
+            sub_keys = self._subkeys()
+            inner_keys = _indices(*_properties(key), len(sub_keys)).range()
+            start = sub_keys.start + inner_keys.start * sub_keys.step
+            step = sub_keys.step * inner_keys.step
+            new_keys = range(start, start + len(inner_keys) * step, step)
+            if new_keys:
+                return SequenceWindow(self._target, _subslice(new_keys))
+            return SequenceWindow(self._target, slice(0, 0))
+        if type(key) is not int:
+            key = operator.index(key)
+        sub_keys = self._subkeys()
+        n = len(sub_keys)
+        if key < 0:
+            key += n
+        if not 0 <= key < n:
+            raise IndexError("window index out of range")
+        return self._target[sub_keys.start + key * sub_keys.step]
 
     def __iter__(self) -> Iterator[T]:
-        sub_keys = self.indices().range()
-        yield from map(self._target.__getitem__, iter(sub_keys))
+        target = self._target
+        sub_keys = self._subkeys()
+        if sub_keys.step == 1 and sub_keys.start == 0 and sub_keys.stop == self._cache_len:
+            return iter(target)
+        if sub_keys and type(target) in (list, tuple, str, bytes, bytearray):
+            return iter(target[_subslice(sub_keys)])
+        return map(target.__getitem__, sub_keys)
 
     def __reversed__(self) -> Iterator[T]:
-        sub_keys = self.indices().range()
-        yield from map(self._target.__getitem__, reversed(sub_keys))
+        target = self._target
+        sub_keys = self._subkeys()
+        if sub_keys.step == 1 and sub_keys.start == 0 and sub_keys.stop == self._cache_len:
+            return reversed(target)
+        if sub_keys and type(target) in (list, tuple, str, bytes, bytearray):
+            return iter(target[_subslice(sub_keys[::-1])])
+        return map(target.__getitem__, reversed(sub_keys))
 
     def __contains__(self, value: Any) -> bool:
-        return any(map(lambda x: x is value or x == value, self))
+        target = self._target
+        if type(target) in (list, tuple):
+            sub_keys = self._subkeys()
+            if not sub_keys:
+                return False
+            return value in target[_subslice(sub_keys)]
+        for x in self:
+            if x is value or x == value:
+                return True
+        return False
 
     @property
     def window(self) -> slice:
@@ -143,4 +209,19 @@ class SequenceWindow(SequenceView[T]):
         contains some convenience methods for conversion to a ``range`` or
         ``slice`` object.
         """
-        return indices(rng=self._window, len=len(self._target))
+        return _indices(*self._window_args, len(self._target))
+
+    def _subkeys(self) -> range:
+        """Return a ``range`` of indices that currently form the visible
+        selection of the target, re-using the last computed ``range`` when the
+        target's length has not changed
+
+        The window itself is fixed for the lifetime of the instance, and so
+        the visible selection can only differ between calls if the target was
+        resized in the interim.
+        """
+        n = len(self._target)
+        if n != self._cache_len:
+            self._cache_keys = _indices(*self._window_args, n).range()
+            self._cache_len = n
+        return self._cache_keys